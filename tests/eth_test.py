@@ -1,13 +1,20 @@
 import time
+from unittest import mock
 
 import pytest
 
+from transaction_manager.config import BLOCK_GAS_LIMIT_TTL
 from transaction_manager.eth import (
     BlockTimeoutError,
+    classify_rpc_error,
+    Eth,
+    is_nonce_too_low,
+    is_replacement_underpriced,
     MAX_WAITING_TIME,
     ReceiptTimeoutError,
+    RPCErrorKind
 )
-from transaction_manager.structures import Tx, TxStatus
+from transaction_manager.structures import Fee, Tx, TxStatus
 
 from tests.utils.account import send_eth
 from tests.utils.timing import in_time
@@ -93,3 +100,81 @@ def test_eth_wait_for_blocks(eth, w3):
     eth.wait_for_blocks(amount=1, max_time=1)
     cblock = w3.eth.block_number
     eth.wait_for_blocks(amount=5, max_time=0, start_block=cblock - 10)
+
+
+def test_eth_convert_tx():
+    tx = Tx(
+        tx_id='1232321332132131331321',
+        chain_id=31337,
+        status=TxStatus.PROPOSED,
+        score=1,
+        to='0x1',
+        value=1,
+        fee={'gas_price': 1000000000},
+        gas=None,
+        nonce=3,
+        source='0x2',
+        data='0x12'
+    )
+    assert Eth.convert_tx(tx) == {
+        'from': '0x2',
+        'to': '0x1',
+        'value': 1,
+        'nonce': 3,
+        'chainId': 31337,
+        'type': 1,
+        'gasPrice': 1000000000,
+        'data': '0x12'
+    }
+
+    tx.fee = Fee(max_fee_per_gas=2000000000, max_priority_fee_per_gas=None)
+    tx.gas, tx.data = 21000, None
+    assert Eth.convert_tx(tx) == {
+        'from': '0x2',
+        'to': '0x1',
+        'value': 1,
+        'nonce': 3,
+        'chainId': 31337,
+        'type': 2,
+        'maxFeePerGas': 2000000000,
+        'maxPriorityFeePerGas': None,
+        'gas': 21000
+    }
+
+
+def test_classify_rpc_error():
+    underpriced = ValueError({
+        'code': -32000,
+        'message': 'replacement transaction underpriced'
+    })
+    assert classify_rpc_error(underpriced) == RPCErrorKind.REPLACEMENT_UNDERPRICED
+    assert is_replacement_underpriced(underpriced)
+    assert not is_nonce_too_low(underpriced)
+
+    nonce_low = ValueError({'code': -32000, 'message': 'nonce too low'})
+    assert classify_rpc_error(nonce_low) == RPCErrorKind.NONCE_TOO_LOW
+    assert is_nonce_too_low(nonce_low)
+
+    assert classify_rpc_error(ValueError({'code': -32000})) == RPCErrorKind.OTHER
+    assert classify_rpc_error(ValueError('nonce')) == RPCErrorKind.OTHER
+    assert classify_rpc_error(ValueError()) == RPCErrorKind.OTHER
+    assert classify_rpc_error(TypeError({'message': 'nonce'})) == RPCErrorKind.OTHER
+
+
+def test_eth_block_gas_limit_cache():
+    fake_w3 = mock.Mock()
+    fake_w3.eth.get_block = mock.Mock(return_value={'gasLimit': 30000000})
+    eth = Eth(fake_w3)
+    with mock.patch('time.monotonic', return_value=1000):
+        assert eth.block_gas_limit == 30000000
+        assert eth.block_gas_limit == 30000000
+    fake_w3.eth.get_block.assert_called_once_with('latest')
+
+    fake_w3.eth.get_block.return_value = {'gasLimit': 31000000}
+    with mock.patch('time.monotonic', return_value=1000 + BLOCK_GAS_LIMIT_TTL):
+        assert eth.block_gas_limit == 30000000
+    assert fake_w3.eth.get_block.call_count == 1
+
+    with mock.patch('time.monotonic', return_value=1001 + BLOCK_GAS_LIMIT_TTL):
+        assert eth.block_gas_limit == 31000000
+    assert fake_w3.eth.get_block.call_count == 2
@@ -4,7 +4,7 @@ import pytest
 from transaction_manager.config import MAX_RESUBMIT_AMOUNT
 from transaction_manager.eth import EstimateGasRevertError
 from transaction_manager.processor import Processor, SendingError
-from transaction_manager.structures import TxStatus
+from transaction_manager.structures import Tx, TxStatus
 
 from tests.utils.contracts import get_tester_abi
 from tests.utils.timing import in_time
@@ -201,3 +201,42 @@ def test_confirm(proc, w3, rdp, tpool, wallet):
     # Make sure next time it is confirmed instantly
     with in_time(0.1):
         proc.confirm(tx)
+
+
+def test_process_next_completion():
+    pool = mock.Mock()
+    pool.to_list = mock.Mock(return_value=[])
+    proc = Processor(
+        mock.Mock(),
+        pool,
+        mock.Mock(),
+        mock.Mock(address='0x1')
+    )
+
+    pool.fetch_next = mock.Mock(return_value=None)
+    assert proc.process_next() is False
+
+    for status, completed in (
+        (TxStatus.SUCCESS, True),
+        (TxStatus.FAILED, True),
+        (TxStatus.DROPPED, True),
+        (TxStatus.UNSENT, False),
+        (TxStatus.TIMEOUT, False)
+    ):
+        tx = Tx(
+            tx_id='1232321332132131331321',
+            status=TxStatus.PROPOSED,
+            score=1,
+            to='0x1',
+            fee={'gas_price': 1000000000}
+        )
+        pool.fetch_next = mock.Mock(return_value=tx)
+        proc.process = mock.Mock(
+            side_effect=lambda tx, status=status: setattr(tx, 'status', status)
+        )
+        assert proc.process_next() is completed
+        proc.process.assert_called_once_with(tx)
+        if completed:
+            pool.release.assert_called_with(tx)
+        else:
+            pool.save.assert_called_with(tx)
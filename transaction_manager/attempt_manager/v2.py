@@ -166,11 +166,12 @@ class AttemptManagerV2(BaseAttemptManager):
                 last.fee.max_fee_per_gas,  # type: ignore
                 min_fee=estimated_base_fee
             )
-            stdc.gauge('tm.max_priority_fee', tip)
-            stdc.gauge('tm.max_fee_per_gas', gap)
             next_fee = Fee(max_priority_fee_per_gas=tip, max_fee_per_gas=gap)
             next_wait_time = self.next_waiting_time(next_index)
-            stdc.gauge('tm.next_wating_time', gap)
+            with stdc.pipeline() as pipe:
+                pipe.gauge('tm.max_priority_fee', tip)
+                pipe.gauge('tm.max_fee_per_gas', gap)
+                pipe.gauge('tm.next_wating_time', gap)
 
         logger.info('Next fee %s', next_fee)
         tx.fee, tx.nonce = next_fee, nonce
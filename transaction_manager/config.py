@@ -48,6 +48,7 @@ DEFAULT_GAS_LIMIT: int = 1000000
 IMA_ID_SUFFIX = 'js'
 STATSD_HOST: str = '127.0.0.1'
 STATSD_PORT: int = 8125
+BLOCK_GAS_LIMIT_TTL: int = 60
 
 # V1
 AVG_GAS_PRICE_INC_PERCENT = 50
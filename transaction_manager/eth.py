@@ -19,16 +19,18 @@
 
 import logging
 import time
-from functools import cached_property
+from enum import Enum
+from functools import cached_property, lru_cache
 from typing import cast, Dict, Optional
 
-from eth_typing.evm import HexStr
+from eth_typing.evm import ChecksumAddress, HexStr
 from web3 import Web3
 from web3.exceptions import ContractLogicError, TransactionNotFound
 from web3.types import FeeHistory, TxParams
 
 from .config import (
     AVG_GAS_PRICE_INC_PERCENT,
+    BLOCK_GAS_LIMIT_TTL,
     CONFIRMATION_BLOCKS,
     DEFAULT_GAS_LIMIT,
     DISABLE_GAS_ESTIMATION,
@@ -61,25 +63,52 @@ REVERT_CODES = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def to_checksum_address(address: str) -> ChecksumAddress:
+    return Web3.to_checksum_address(address)
+
+
+class RPCErrorKind(Enum):
+    OTHER = 0
+    REPLACEMENT_UNDERPRICED = 1
+    NONCE_TOO_LOW = 2
+
+
+def classify_rpc_error(err: Exception) -> RPCErrorKind:
+    if not isinstance(err, ValueError) or len(err.args) == 0 or \
+            not isinstance(err.args[0], dict):
+        return RPCErrorKind.OTHER
+    message = err.args[0].get('message') or ''
+    if message == 'replacement transaction underpriced':
+        return RPCErrorKind.REPLACEMENT_UNDERPRICED
+    if 'nonce' in message:
+        return RPCErrorKind.NONCE_TOO_LOW
+    return RPCErrorKind.OTHER
+
+
 def is_replacement_underpriced(err: Exception) -> bool:
-    return isinstance(err, ValueError) and \
-        isinstance(err.args[0], dict) and \
-        err.args[0].get('message') == 'replacement transaction underpriced'
+    return classify_rpc_error(err) == RPCErrorKind.REPLACEMENT_UNDERPRICED
 
 
 def is_nonce_too_low(err: Exception) -> bool:
-    return isinstance(err, ValueError) and 'nonce' in err.args[0]['message']
+    return classify_rpc_error(err) == RPCErrorKind.NONCE_TOO_LOW
 
 
 class Eth:
     def __init__(self, web3: Optional[Web3] = None) -> None:
         self.w3: Web3 = web3 or gw3
+        self._gas_limit: Optional[int] = None
+        self._gas_limit_ts: float = 0
 
     @property
     def block_gas_limit(self) -> int:
-        latest_block_number = self.w3.eth.block_number
-        block = self.w3.eth.get_block(latest_block_number)
-        return block['gasLimit']
+        now = time.monotonic()
+        gas_limit = self._gas_limit
+        if gas_limit is None or now - self._gas_limit_ts > BLOCK_GAS_LIMIT_TTL:
+            block = self.w3.eth.get_block('latest')
+            gas_limit = cast(int, block['gasLimit'])
+            self._gas_limit, self._gas_limit_ts = gas_limit, now
+        return gas_limit
 
     @cached_property
     def chain_id(self) -> int:
@@ -87,22 +116,9 @@ class Eth:
             return self.w3.eth.chain_id
 
     def get_balance(self, address: str) -> int:
-        checksum_addres = self.w3.to_checksum_address(address)
+        checksum_addres = to_checksum_address(address)
         return self.w3.eth.get_balance(checksum_addres)
 
-    TX_ATTRS = [
-        'from',
-        'to',
-        'value',
-        'nonce',
-        'chainId',
-        'gas',
-        'data',
-        'gasPrice',
-        'maxFeePerGas',
-        'maxPriorityFeePerGas'
-    ]
-
     def get_fee_history(self) -> FeeHistory:
         return self.w3.eth.fee_history(
             1,
@@ -123,21 +139,27 @@ class Eth:
 
     @classmethod
     def convert_tx(cls, tx: Tx) -> Dict:
-        raw_tx = tx.raw_tx
-        etx = {attr: raw_tx[attr] for attr in cls.TX_ATTRS}
-        if etx.get('maxPriorityFeePerGas') is not None or \
-                etx.get('maxFeePerGas') is not None:
+        fee = tx.fee
+        etx: Dict = {
+            'from': tx.source,
+            'to': tx.to,
+            'value': tx.value,
+            'nonce': tx.nonce,
+            'chainId': tx.chain_id
+        }
+        if fee.max_priority_fee_per_gas is not None or \
+                fee.max_fee_per_gas is not None:
             etx['type'] = 2
-            etx.pop('gasPrice', None)
+            etx['maxFeePerGas'] = fee.max_fee_per_gas
+            etx['maxPriorityFeePerGas'] = fee.max_priority_fee_per_gas
         else:
             etx['type'] = 1
-            etx.pop('maxPriorityFeePerGas', None)
-            etx.pop('maxFeePerGas', None)
+            etx['gasPrice'] = fee.gas_price
 
-        if etx.get('gas') is None:
-            etx.pop('gas')
-        if etx.get('data') is None:
-            etx.pop('data')
+        if tx.gas is not None:
+            etx['gas'] = tx.gas
+        if tx.data is not None:
+            etx['data'] = tx.data
         return etx
 
     @property
@@ -191,7 +213,7 @@ class Eth:
         return tx_hash
 
     def get_nonce(self, address: str) -> int:
-        checksum_addres = self.w3.to_checksum_address(address)
+        checksum_addres = to_checksum_address(address)
         return self.w3.eth.get_transaction_count(checksum_addres)
 
     def wait_for_blocks(
@@ -77,8 +77,8 @@ class Processor:
             try:
                 tx_hash = self.eth.send_tx(signed)
             except Exception as e:
-                logger.info(f'Sending failed with error {err}')
                 err = e
+                logger.info('Sending failed with error %s', err)
                 if is_replacement_underpriced(err):
                     logger.info('Replacement fee is too low. Increasing')
                     self.attempt_manager.replace(tx, replace_attempt=retry)
@@ -107,7 +107,7 @@ class Processor:
                 'Waiting for %s, with hash %s, timeout %d',
                 tx.tx_id, tx.tx_hash, max_time
             )
-            self.eth.wait_for_receipt(
+            rstatus = self.eth.wait_for_receipt(
                 tx_hash=tx.tx_hash,
                 max_time=max_time
             )
@@ -116,10 +116,6 @@ class Processor:
             tx.status = TxStatus.TIMEOUT
             raise WaitTimeoutError(err)
 
-        rstatus = self.eth.wait_for_receipt(
-            tx_hash=tx.tx_hash,
-            max_time=max_time
-        )
         if rstatus is not None:
             logger.info('Setting tx %s as mined', tx.tx_id)
             tx.set_as_mined()
@@ -192,8 +188,9 @@ class Processor:
         try:
             yield tx
         finally:
-            stdc.gauge('tm.attempt', tx.attempts)
-            stdc.incr(f'tm.transaction.{tx.status.name}')
+            with stdc.pipeline() as pipe:
+                pipe.gauge('tm.attempt', tx.attempts)
+                pipe.incr(f'tm.transaction.{tx.status.name}')
             if tx.is_sent():
                 self.attempt_manager.save()
             if not tx.is_completed() and tx.is_last_attempt():
@@ -203,26 +200,30 @@ class Processor:
             else:
                 self.pool.save(tx)
 
-    def process_next(self) -> None:
+    def process_next(self) -> bool:
         txs = self.pool.to_list()
         if txs:
             logger.info('Pool: %s', txs)
         tx = self.pool.fetch_next()
         self.attempt_manager.fetch()
-        if tx is not None:
-            with self.acquire_tx(tx) as tx:
-                logger.info(
-                    'Previous attempt %s', self.attempt_manager.current)
-                with stdc.timer('tm.transaction.time'):
-                    self.process(tx)
+        if tx is None:
+            return False
+        with self.acquire_tx(tx) as tx:
+            logger.info(
+                'Previous attempt %s', self.attempt_manager.current)
+            with stdc.timer('tm.transaction.time'):
+                self.process(tx)
+        return tx.is_completed()
 
     def run(self) -> None:
         while True:
+            completed = False
             try:
                 stdc.gauge('tm.pool.size', self.pool.size)
-                self.process_next()
+                completed = self.process_next()
             except Exception:
                 logger.exception('Failed to process tx')
                 logger.info('Waiting for next tx')
             finally:
-                time.sleep(1)
+                if not completed:
+                    time.sleep(1)
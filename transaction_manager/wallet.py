@@ -21,6 +21,7 @@ import logging
 import os
 from typing import Optional
 
+from eth_keys.backends import get_backend
 from skale.wallets import BaseWallet, SgxWallet, Web3Wallet  # type: ignore
 from web3 import Web3
 
@@ -54,7 +55,10 @@ def init_wallet(
             path_to_cert=path_to_cert
         )
     elif ETH_PRIVATE_KEY:
-        logger.info('Initializing web3 wallet')
+        logger.info(
+            'Initializing web3 wallet, ECC backend %s',
+            get_backend().__class__.__name__
+        )
         wallet = Web3Wallet(ETH_PRIVATE_KEY, w3)
     if not wallet:
         logger.warning('Both SGX_URL and ETH_PRIVATE_KEY was not provided')